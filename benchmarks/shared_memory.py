@@ -0,0 +1,81 @@
+import argparse
+import multiprocessing
+import resource
+import time
+from python_carbon import CalendarTable
+
+TABLE_NAME = 'python_carbon_benchmark_calendar'
+
+
+def memory_usage() -> dict:
+    usage = {'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 'pss': None}
+
+    # Proportional set size splits shared pages between the processes mapping
+    # them, so it is the number that shows what sharing saves. Linux only.
+    try:
+        with open('/proc/self/smaps_rollup', encoding='ascii') as smaps:
+            for line in smaps:
+                if line.startswith('Rss:'):
+                    usage['rss'] = int(line.split()[1])
+                elif line.startswith('Pss:'):
+                    usage['pss'] = int(line.split()[1])
+    except OSError:
+        pass
+
+    return usage
+
+
+def worker(args: tuple) -> dict:
+    shared, first_year, last_year = args
+    before = memory_usage()
+    started = time.perf_counter()
+
+    table = CalendarTable.attach(TABLE_NAME) if shared else CalendarTable.build(first_year, last_year)
+    checksum = sum(table.values)
+    warm_up = time.perf_counter() - started
+
+    after = memory_usage()
+    table.close()
+
+    return {
+        'warm_up': warm_up,
+        'rss': after['rss'] - before['rss'],
+        'pss': None if after['pss'] is None else after['pss'] - before['pss'],
+        'checksum': checksum,
+    }
+
+
+def run(shared: bool, workers: int, first_year: int, last_year: int) -> list:
+    context = multiprocessing.get_context('spawn')
+
+    with context.Pool(workers) as pool:
+        return pool.map(worker, [(shared, first_year, last_year)] * workers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare per-worker memory and warm-up time with and without shared Carbon tables.')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--first-year', type=int, default=1)
+    parser.add_argument('--last-year', type=int, default=9999)
+    args = parser.parse_args()
+
+    published = CalendarTable.build(args.first_year, args.last_year).publish(TABLE_NAME)
+
+    try:
+        print(f"{'sharing':<8} {'workers':>8} {'warm-up (ms)':>14} {'RSS (KiB)':>14} {'PSS (KiB)':>14}")
+
+        for shared in (False, True):
+            results = run(shared, args.workers, args.first_year, args.last_year)
+            pss = [result['pss'] for result in results if result['pss'] is not None]
+            warm_up = 1000 * sum(result['warm_up'] for result in results) / len(results)
+            rss = sum(result['rss'] for result in results) / len(results)
+            pss_column = f'{sum(pss) / len(pss):.0f}' if pss else 'n/a'
+
+            print(f"{'on' if shared else 'off':<8} {args.workers:>8d} {warm_up:>14.2f} {rss:>14.0f} {pss_column:>14}")
+    finally:
+        published.close()
+        published.unlink()
+
+
+if __name__ == '__main__':
+    main()
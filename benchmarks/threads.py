@@ -0,0 +1,51 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from python_carbon import Carbon
+
+ANCHOR = Carbon.parse('2021-08-18 14:15:16.123456')
+
+WORKLOADS = {
+    'parse': lambda: Carbon.parse('2021-08-18 14:15:16'),
+    'createFromFormat': lambda: Carbon.createFromFormat('%Y-%m-%d %H:%M:%S', '2021-08-18 14:15:16'),
+    'format': lambda: ANCHOR.toDateTimeString(),
+    'arithmetic': lambda: ANCHOR.addDays(3).addMonths(1).startOfWeek(),
+}
+
+
+def run(workload, threads: int, iterations: int) -> float:
+    def worker(_) -> None:
+        for _ in range(iterations):
+            workload()
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        started = time.perf_counter()
+        list(executor.map(worker, range(threads)))
+        elapsed = time.perf_counter() - started
+
+    return threads * iterations / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure Carbon throughput as the number of threads grows.')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--iterations', type=int, default=20000, help='operations per thread')
+    parser.add_argument('--workloads', nargs='+', choices=sorted(WORKLOADS), default=list(WORKLOADS))
+    args = parser.parse_args()
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python ' + sys.version.split()[0] + ', GIL ' + ('enabled' if gil_enabled else 'disabled'))
+    print(f"{'workload':<18} {'threads':>8} {'ops/s':>14} {'scaling':>9}")
+
+    for name in args.workloads:
+        baseline = None
+
+        for threads in args.threads:
+            throughput = run(WORKLOADS[name], threads, args.iterations)
+            baseline = baseline or throughput
+            print(f'{name:<18} {threads:>8d} {throughput:>14.0f} {throughput / baseline:>8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
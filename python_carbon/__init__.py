@@ -1,10 +1,16 @@
-from calendar import isleap, monthcalendar, monthrange
+from calendar import isleap, monthrange
 from datetime import datetime, timedelta
+from importlib import import_module
 from types import MethodType
-from typing import Union
+from typing import TYPE_CHECKING, Iterable, List, Union
 from dateutil.parser import parse as date_parser
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzutc
+from python_carbon.formats import strptime
+from python_carbon.merge import merge  # noqa: F401  pylint: disable=unused-import
+
+if TYPE_CHECKING:
+    from python_carbon.carbon_date import CarbonDate
 
 
 class Carbon:
@@ -68,12 +74,18 @@ class Carbon:
 
     @staticmethod
     def createFromFormat(format_string: str, date_string: str) -> 'Carbon':
-        return Carbon(datetime.strptime(date_string, format_string))
+        return Carbon(strptime(date_string, format_string))
 
     @staticmethod
     def createFromTimestamp(timestamp: int) -> 'Carbon':
         return Carbon(datetime.fromtimestamp(timestamp))
 
+    @staticmethod
+    def lazy(raw: Union[str, bytes], format_string: str = None) -> 'Carbon':
+        from python_carbon.lazy import LazyCarbon
+
+        return LazyCarbon(raw, format_string)
+
     ##############
     # Properties #
     ##############
@@ -121,27 +133,13 @@ class Carbon:
         return self._date.timetuple().tm_yday
 
     def getWeekOfMonth(self, start: int = 0) -> int:
-        weeks = monthcalendar(self.getYear(), self.getMonth())
-        day = self.getDay()
-
-        for key, week in enumerate(weeks, start=start):
-            if day in week:
-                return key
-
-        raise ValueError
+        return (self.getDay() - 1 + self.getMonthFirstWeekDay()) // 7 + start
 
     def getWeekOfYear(self) -> int:
         return int(self.format('%W'))
 
     def getQuarter(self, start: int = 1) -> int:
-        quarters = self.getQuarters(start)
-        month = self.getMonth()
-
-        for key, quarter in enumerate(quarters):
-            if month in quarter:
-                return key
-
-        raise ValueError
+        return ((self._date.month - start) % 12) // 3
 
     def getQuarters(self, start: int = 1) -> list:
         months_amount = 12
@@ -163,10 +161,45 @@ class Carbon:
         return quarters
 
     def getDaysInMonth(self) -> int:
-        return monthrange(self.getDay(), self.getMonth())[1]
+        return monthrange(self.getYear(), self.getMonth())[1]
 
     def getMonthFirstWeekDay(self) -> int:
-        return monthrange(self.getDay(), self.getMonth())[0]
+        return monthrange(self.getYear(), self.getMonth())[0]
+
+    ###############
+    # Period keys #
+    ###############
+
+    def getMinuteKey(self) -> int:
+        return self.getHourKey() * 60 + self._date.minute
+
+    def getHourKey(self) -> int:
+        return self._date.toordinal() * 24 + self._date.hour
+
+    def getDayKey(self) -> int:
+        return self._date.toordinal()
+
+    def getWeekKey(self) -> int:
+        # Ordinal 1 (0001-01-01) is a Monday, so this counts ISO weeks.
+        return (self._date.toordinal() - 1) // 7
+
+    def getMonthKey(self) -> int:
+        return self._date.year * 12 + self._date.month - 1
+
+    def getQuarterKey(self, start: int = 1) -> int:
+        return (self._date.year * 12 + self._date.month - start) // 3
+
+    def getYearKey(self) -> int:
+        return self._date.year
+
+    @staticmethod
+    def periodKeys(carbons: Iterable['Carbon'], unit: str, start: int = 1) -> List[int]:
+        method = getattr(Carbon, 'get' + unit.capitalize() + 'Key')
+
+        if unit.lower() == 'quarter':
+            return [method(carbon, start) for carbon in carbons]
+
+        return [method(carbon) for carbon in carbons]
 
     ###########
     # Setters #
@@ -261,46 +294,40 @@ class Carbon:
         return self.getTimestamp() > low.getTimestamp() and self.getTimestamp() < high.getTimestamp()
 
     def isSameMinute(self, carbon: 'Carbon', match_date: bool = True) -> bool:
-        return (self.getMinute() == carbon.getMinute()) if not match_date else (
-            self.getYear() == carbon.getYear()
-            and self.getMonth() == carbon.getMonth()
-            and self.getDay() == carbon.getDay()
-            and self.getHour() == carbon.getHour()
-            and self.getMinute() == carbon.getMinute()
-        )
+        if not match_date:
+            return self.getMinute() == carbon.getMinute()
+
+        return self.getMinuteKey() == carbon.getMinuteKey()
 
     def isSameHour(self, carbon: 'Carbon', match_date: bool = True) -> bool:
-        return (self.getHour() == carbon.getHour()) if not match_date else (
-            self.getYear() == carbon.getYear()
-            and self.getMonth() == carbon.getMonth()
-            and self.getDay() == carbon.getDay()
-            and self.getHour() == carbon.getHour()
-        )
+        if not match_date:
+            return self.getHour() == carbon.getHour()
+
+        return self.getHourKey() == carbon.getHourKey()
 
     def isSameDay(self, carbon: 'Carbon', match_date: bool = True) -> bool:
-        return (self.getDay() == carbon.getDay()) if not match_date else (
-            self.getYear() == carbon.getYear()
-            and self.getMonth() == carbon.getMonth()
-            and self.getDay() == carbon.getDay()
-        )
+        if not match_date:
+            return self.getDay() == carbon.getDay()
+
+        return self.getDayKey() == carbon.getDayKey()
 
     def isSameWeek(self, carbon: 'Carbon') -> bool:
-        return self.getWeekOfMonth() == carbon.getWeekOfMonth()
+        return self.getWeekKey() == carbon.getWeekKey()
 
     def isSameMonth(self, carbon: 'Carbon', match_date: bool = True) -> bool:
-        return (self.getMonth() == carbon.getMonth()) if not match_date else (
-            self.getYear() == carbon.getYear()
-            and self.getMonth() == carbon.getMonth()
-        )
+        if not match_date:
+            return self.getMonth() == carbon.getMonth()
+
+        return self.getMonthKey() == carbon.getMonthKey()
 
     def isSameYear(self, carbon: 'Carbon') -> bool:
-        return self.getYear() == carbon.getYear()
+        return self.getYearKey() == carbon.getYearKey()
 
-    def isSameQuarter(self, carbon: 'Carbon', match_date: bool = True) -> bool:
-        return (self.getQuarter() == carbon.getQuarter()) if not match_date else (
-            self.getYear() == carbon.getYear()
-            and self.getQuarter() == carbon.getQuarter()
-        )
+    def isSameQuarter(self, carbon: 'Carbon', match_date: bool = True, start: int = 1) -> bool:
+        if not match_date:
+            return self.getQuarter(start) == carbon.getQuarter(start)
+
+        return self.getQuarterKey(start) == carbon.getQuarterKey(start)
 
     ##########
     # Checks #
@@ -360,7 +387,7 @@ class Carbon:
         return self._date.weekday() == weekday
 
     def isLastDayOfMonth(self) -> bool:
-        return self.getDay() == monthrange(self.getDay(), self.getMonth())[1]
+        return self.getDay() == self.getDaysInMonth()
 
     def isFirstDayOfMonth(self) -> bool:
         return self.getDay() == 1
@@ -478,6 +505,11 @@ class Carbon:
     def utc(self) -> 'Carbon':
         return Carbon(self._date.astimezone(tzutc()))
 
+    def toCarbonDate(self) -> 'CarbonDate':
+        from python_carbon.carbon_date import CarbonDate
+
+        return CarbonDate(self._date.toordinal())
+
     #############
     # Modifiers #
     #############
@@ -586,7 +618,7 @@ class Carbon:
 
     def startOfMonth(self) -> 'Carbon':
         return Carbon(
-            self.startOfWeek().addDays(6).toDatetime().replace(
+            self._date.replace(
                 day=1,
                 hour=0,
                 minute=0,
@@ -597,7 +629,7 @@ class Carbon:
 
     def endOfMonth(self) -> 'Carbon':
         return Carbon(
-            self.startOfWeek().addDays(6).toDatetime().replace(
+            self._date.replace(
                 day=self.getDaysInMonth(),
                 hour=23,
                 minute=59,
@@ -630,6 +662,18 @@ class Carbon:
             )
         )
 
+    def modify(self, expression: str) -> 'Carbon':
+        from python_carbon.modifiers import apply_modifier, compile_modifier
+
+        return apply_modifier(self, compile_modifier(expression))
+
+    @staticmethod
+    def modifyAll(carbons: Iterable['Carbon'], expression: str) -> List['Carbon']:
+        from python_carbon.modifiers import apply_modifier, compile_modifier
+
+        operations = compile_modifier(expression)
+        return [apply_modifier(carbon, operations) for carbon in carbons]
+
     def next(self, weekday: int = None) -> 'Carbon':
         weekday = weekday if weekday is not None else datetime.now().weekday()
         return Carbon(self._date + timedelta(days=weekday - self._date.weekday() + 7))
@@ -684,3 +728,35 @@ class Carbon:
             return attribute(*args, **kwargs)
 
         return method()
+
+
+# Submodules import Carbon from here, so their names are resolved on first
+# use instead of at the bottom of this module. This also keeps asyncio, mmap
+# and multiprocessing out of a plain "import python_carbon".
+_LAZY_EXPORTS = {
+    'CalendarTable': 'python_carbon.shared',
+    'CarbonDate': 'python_carbon.carbon_date',
+    'Discontinuity': 'python_carbon.gaps',
+    'LazyCarbon': 'python_carbon.lazy',
+    'LogScanner': 'python_carbon.scanner',
+    'SharedTable': 'python_carbon.shared',
+    'TimeIndex': 'python_carbon.index',
+    'TimerHandle': 'python_carbon.wheel',
+    'TimerWheel': 'python_carbon.wheel',
+    'TimestampColumn': 'python_carbon.codec',
+    'TimestampEncoder': 'python_carbon.codec',
+    'apply_modifier': 'python_carbon.modifiers',
+    'compile_modifier': 'python_carbon.modifiers',
+    'detect_gaps': 'python_carbon.gaps',
+    'detect_gaps_epoch': 'python_carbon.gaps',
+    'encode': 'python_carbon.codec',
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError('module ' + __name__ + ' has no attribute ' + name)
+
+    value = globals()[name] = getattr(import_module(_LAZY_EXPORTS[name]), name)
+
+    return value
@@ -0,0 +1,317 @@
+from calendar import isleap
+from datetime import date, datetime
+from typing import Tuple, Union
+from dateutil.parser import parse as date_parser
+
+from python_carbon import Carbon
+from python_carbon.formats import strptime
+
+_DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_MAX_ORDINAL = date.max.toordinal()
+
+
+def _days_in_month(year: int, month: int) -> int:
+    return 29 if month == 2 and isleap(year) else _DAYS_IN_MONTH[month]
+
+
+def _to_ordinal(year: int, month: int, day: int) -> int:
+    previous = year - 1
+    leap_day = 1 if month > 2 and isleap(year) else 0
+
+    return previous * 365 + previous // 4 - previous // 100 + previous // 400 \
+        + _DAYS_BEFORE_MONTH[month] + leap_day + day
+
+
+def _from_ordinal(ordinal: int) -> Tuple[int, int, int]:
+    # Counts days from 0000-03-01 so that leap days fall at the end of each year.
+    days = ordinal + 305
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096) // 365
+    day_of_year = day_of_era - (365 * year_of_era + year_of_era // 4 - year_of_era // 100)
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + 3 if shifted_month < 10 else shifted_month - 9
+
+    return year_of_era + era * 400 + (1 if month <= 2 else 0), month, day
+
+
+class CarbonDate:
+
+    __slots__ = ('_ordinal',)
+
+    MONDAY = Carbon.MONDAY
+    TUESDAY = Carbon.TUESDAY
+    WEDNESDAY = Carbon.WEDNESDAY
+    THURSDAY = Carbon.THURSDAY
+    FRIDAY = Carbon.FRIDAY
+    SATURDAY = Carbon.SATURDAY
+    SUNDAY = Carbon.SUNDAY
+
+    def __init__(self, now: Union['CarbonDate', Carbon, date, int, None] = None):
+        if now is None:
+            self._ordinal = date.today().toordinal()
+            return
+
+        if isinstance(now, int):
+            if not 1 <= now <= _MAX_ORDINAL:
+                raise ValueError
+
+            self._ordinal = now
+            return
+
+        if isinstance(now, date):
+            self._ordinal = now.toordinal()
+            return
+
+        if isinstance(now, Carbon):
+            self._ordinal = now.toDatetime().toordinal()
+            return
+
+        if isinstance(now, CarbonDate):
+            self._ordinal = now.getOrdinal()
+            return
+
+        raise ValueError
+
+    #################
+    # Instantiation #
+    #################
+
+    @staticmethod
+    def parse(date_string: str) -> 'CarbonDate':
+        return CarbonDate(date_parser(date_string))
+
+    @staticmethod
+    def today() -> 'CarbonDate':
+        return CarbonDate(date.today())
+
+    @staticmethod
+    def createFromDate(year: int, month: int, day: int) -> 'CarbonDate':
+        if not 1 <= month <= 12 or not 1 <= day <= _days_in_month(year, month):
+            raise ValueError
+
+        return CarbonDate(_to_ordinal(year, month, day))
+
+    @staticmethod
+    def createFromFormat(format_string: str, date_string: str) -> 'CarbonDate':
+        return CarbonDate(strptime(date_string, format_string))
+
+    ###########
+    # Getters #
+    ###########
+
+    def getOrdinal(self) -> int:
+        return self._ordinal
+
+    def getYear(self) -> int:
+        return _from_ordinal(self._ordinal)[0]
+
+    def getMonth(self) -> int:
+        return _from_ordinal(self._ordinal)[1]
+
+    def getDay(self) -> int:
+        return _from_ordinal(self._ordinal)[2]
+
+    def getDayOfWeek(self) -> int:
+        return (self._ordinal + 6) % 7
+
+    def getDayOfYear(self) -> int:
+        return self._ordinal - _to_ordinal(self.getYear(), 1, 1) + 1
+
+    def getQuarter(self, start: int = 1) -> int:
+        return ((self.getMonth() - start) % 12) // 3
+
+    def getDaysInMonth(self) -> int:
+        year, month, _ = _from_ordinal(self._ordinal)
+        return _days_in_month(year, month)
+
+    ##############
+    # Formatting #
+    ##############
+
+    def format(self, format_string: str) -> str:
+        return self.toDate().strftime(format_string)
+
+    def toDateString(self) -> str:
+        year, month, day = _from_ordinal(self._ordinal)
+        return str(year).zfill(4) + '-' + str(month).zfill(2) + '-' + str(day).zfill(2)
+
+    def toDate(self) -> date:
+        return date.fromordinal(self._ordinal)
+
+    def toCarbon(self) -> Carbon:
+        return Carbon(datetime.fromordinal(self._ordinal))
+
+    ##############
+    # Comparison #
+    ##############
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CarbonDate) and self._ordinal == other.getOrdinal()
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, CarbonDate):
+            return NotImplemented
+
+        return self._ordinal < other.getOrdinal()
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, CarbonDate):
+            return NotImplemented
+
+        return self._ordinal <= other.getOrdinal()
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, CarbonDate):
+            return NotImplemented
+
+        return self._ordinal > other.getOrdinal()
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, CarbonDate):
+            return NotImplemented
+
+        return self._ordinal >= other.getOrdinal()
+
+    def __hash__(self) -> int:
+        return hash(self._ordinal)
+
+    def __repr__(self) -> str:
+        return 'CarbonDate(' + self.toDateString() + ')'
+
+    def equalTo(self, carbon_date: 'CarbonDate') -> bool:
+        return self._ordinal == carbon_date.getOrdinal()
+
+    def notEqualTo(self, carbon_date: 'CarbonDate') -> bool:
+        return self._ordinal != carbon_date.getOrdinal()
+
+    def greaterThan(self, carbon_date: 'CarbonDate') -> bool:
+        return self._ordinal > carbon_date.getOrdinal()
+
+    def greaterThanOrEqualTo(self, carbon_date: 'CarbonDate') -> bool:
+        return self._ordinal >= carbon_date.getOrdinal()
+
+    def lessThan(self, carbon_date: 'CarbonDate') -> bool:
+        return self._ordinal < carbon_date.getOrdinal()
+
+    def lessThanOrEqualTo(self, carbon_date: 'CarbonDate') -> bool:
+        return self._ordinal <= carbon_date.getOrdinal()
+
+    def between(self, low: 'CarbonDate', high: 'CarbonDate', included: bool = True) -> bool:
+        return self.betweenIncluded(low, high) if included else self.betweenExcluded(low, high)
+
+    def betweenIncluded(self, low: 'CarbonDate', high: 'CarbonDate') -> bool:
+        return low.getOrdinal() <= self._ordinal <= high.getOrdinal()
+
+    def betweenExcluded(self, low: 'CarbonDate', high: 'CarbonDate') -> bool:
+        return low.getOrdinal() < self._ordinal < high.getOrdinal()
+
+    ##########
+    # Checks #
+    ##########
+
+    def isWeekend(self) -> bool:
+        return self.getDayOfWeek() >= self.SATURDAY
+
+    def isDayOfWeek(self, weekday: int) -> bool:
+        return self.getDayOfWeek() == weekday
+
+    def isLeapYear(self) -> bool:
+        return isleap(self.getYear())
+
+    def isFirstDayOfMonth(self) -> bool:
+        return self.getDay() == 1
+
+    def isLastDayOfMonth(self) -> bool:
+        year, month, day = _from_ordinal(self._ordinal)
+        return day == _days_in_month(year, month)
+
+    ############################
+    # Addition and Subtraction #
+    ############################
+
+    def _add_or_sub(self, prefix: str, amount: int, unit: str) -> 'CarbonDate':
+        method = getattr(self, (prefix + unit.capitalize()))
+        return method(amount)
+
+    def add(self, amount: int, unit: str) -> 'CarbonDate':
+        return self._add_or_sub('add', amount, unit)
+
+    def addDays(self, days: int = 1) -> 'CarbonDate':
+        return CarbonDate(self._ordinal + days)
+
+    def addWeeks(self, weeks: int = 1) -> 'CarbonDate':
+        return CarbonDate(self._ordinal + weeks * 7)
+
+    def addMonths(self, months: int = 1) -> 'CarbonDate':
+        year, month, day = _from_ordinal(self._ordinal)
+        year, month = divmod(year * 12 + month - 1 + months, 12)
+        month += 1
+
+        return CarbonDate(_to_ordinal(year, month, min(day, _days_in_month(year, month))))
+
+    def addYears(self, years: int = 1) -> 'CarbonDate':
+        return self.addMonths(years * 12)
+
+    def sub(self, amount: int, unit: str) -> 'CarbonDate':
+        return self._add_or_sub('sub', amount, unit)
+
+    def subDays(self, days: int = 1) -> 'CarbonDate':
+        return self.addDays(-days)
+
+    def subWeeks(self, weeks: int = 1) -> 'CarbonDate':
+        return self.addWeeks(-weeks)
+
+    def subMonths(self, months: int = 1) -> 'CarbonDate':
+        return self.addMonths(-months)
+
+    def subYears(self, years: int = 1) -> 'CarbonDate':
+        return self.addMonths(-years * 12)
+
+    ##############
+    # Difference #
+    ##############
+
+    def diffInDays(self, carbon_date: 'CarbonDate') -> int:
+        return self._ordinal - carbon_date.getOrdinal()
+
+    def diffInWeeks(self, carbon_date: 'CarbonDate') -> float:
+        return self.diffInDays(carbon_date) / 7
+
+    #############
+    # Modifiers #
+    #############
+
+    def _start_or_end(self, prefix: str, unit: str) -> 'CarbonDate':
+        method = getattr(self, (prefix + 'Of' + unit.capitalize()))
+        return method()
+
+    def startOf(self, unit: str) -> 'CarbonDate':
+        return self._start_or_end('start', unit)
+
+    def endOf(self, unit: str) -> 'CarbonDate':
+        return self._start_or_end('end', unit)
+
+    def startOfWeek(self) -> 'CarbonDate':
+        return CarbonDate(self._ordinal - self.getDayOfWeek())
+
+    def endOfWeek(self) -> 'CarbonDate':
+        return CarbonDate(self._ordinal - self.getDayOfWeek() + 6)
+
+    def startOfMonth(self) -> 'CarbonDate':
+        return CarbonDate(self._ordinal - self.getDay() + 1)
+
+    def endOfMonth(self) -> 'CarbonDate':
+        year, month, day = _from_ordinal(self._ordinal)
+        return CarbonDate(self._ordinal - day + _days_in_month(year, month))
+
+    def startOfYear(self) -> 'CarbonDate':
+        return CarbonDate(_to_ordinal(self.getYear(), 1, 1))
+
+    def endOfYear(self) -> 'CarbonDate':
+        return CarbonDate(_to_ordinal(self.getYear(), 12, 31))
@@ -0,0 +1,230 @@
+import struct
+from array import array
+from typing import Iterable, Iterator, List, Tuple
+
+from python_carbon import Carbon
+
+MAGIC = b'CTS1'
+
+_STREAM_HEADER = struct.Struct('<4sI')
+# first value, min value, max value, value count, payload bytes
+_BLOCK_HEADER = struct.Struct('<qqqII')
+
+# Delta-of-delta buckets as (prefix, prefix bits, value bits), smallest first.
+# A zero delta-of-delta is written as a single 0 bit.
+_BUCKETS = ((0b10, 2, 7), (0b110, 3, 9), (0b1110, 4, 12), (0b1111, 4, 64))
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+class _BitWriter:
+
+    __slots__ = ('buffer', '_accumulator', '_bits')
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self._accumulator = 0
+        self._bits = 0
+
+    def write(self, value: int, bits: int) -> None:
+        self._accumulator = (self._accumulator << bits) | value
+        self._bits += bits
+
+        while self._bits >= 8:
+            self._bits -= 8
+            self.buffer.append((self._accumulator >> self._bits) & 0xFF)
+
+        self._accumulator &= (1 << self._bits) - 1
+
+    def flush(self) -> bytes:
+        if self._bits:
+            self.buffer.append((self._accumulator << (8 - self._bits)) & 0xFF)
+
+        return bytes(self.buffer)
+
+
+class _BitReader:
+
+    __slots__ = ('_data', '_position', '_accumulator', '_bits')
+
+    def __init__(self, data: memoryview):
+        self._data = data
+        self._position = 0
+        self._accumulator = 0
+        self._bits = 0
+
+    def read(self, bits: int) -> int:
+        while self._bits < bits:
+            self._accumulator = (self._accumulator << 8) | self._data[self._position]
+            self._position += 1
+            self._bits += 8
+
+        self._bits -= bits
+        value = self._accumulator >> self._bits
+        self._accumulator &= (1 << self._bits) - 1
+
+        return value
+
+
+class TimestampEncoder:
+
+    def __init__(self, resolution: int = 1_000_000, block_size: int = 1024):
+        if resolution < 1 or block_size < 1:
+            raise ValueError
+
+        self.resolution = resolution
+        self.block_size = block_size
+
+        self._output = bytearray(_STREAM_HEADER.pack(MAGIC, resolution))
+        self._start_block()
+
+    def append(self, carbon: Carbon) -> None:
+        self.append_epoch(round(carbon.getTimestamp() * self.resolution))
+
+    def append_epoch(self, value: int) -> None:
+        if self._count == 0:
+            self._first = self._minimum = self._maximum = self._previous = value
+            self._count = 1
+            return
+
+        delta = value - self._previous
+        delta_of_delta = delta - self._delta
+
+        if delta_of_delta == 0:
+            self._writer.write(0, 1)
+        else:
+            encoded = _zigzag(delta_of_delta)
+
+            for prefix, prefix_bits, value_bits in _BUCKETS:
+                if encoded < 1 << value_bits:
+                    self._writer.write(prefix, prefix_bits)
+                    self._writer.write(encoded, value_bits)
+                    break
+            else:
+                raise OverflowError('Delta of delta does not fit in 64 bits')
+
+        self._previous = value
+        self._delta = delta
+        self._minimum = min(self._minimum, value)
+        self._maximum = max(self._maximum, value)
+        self._count += 1
+
+        if self._count == self.block_size:
+            self._close_block()
+
+    def extend(self, carbons: Iterable[Carbon]) -> None:
+        for carbon in carbons:
+            self.append(carbon)
+
+    def finish(self) -> bytes:
+        self._close_block()
+
+        return bytes(self._output)
+
+    def _start_block(self) -> None:
+        self._writer = _BitWriter()
+        self._count = 0
+        self._first = self._minimum = self._maximum = self._previous = 0
+        self._delta = 0
+
+    def _close_block(self) -> None:
+        if self._count:
+            payload = self._writer.flush()
+            self._output += _BLOCK_HEADER.pack(self._first, self._minimum, self._maximum, self._count, len(payload))
+            self._output += payload
+
+        self._start_block()
+
+
+def encode(carbons: Iterable[Carbon], resolution: int = 1_000_000, block_size: int = 1024) -> bytes:
+    encoder = TimestampEncoder(resolution, block_size)
+    encoder.extend(carbons)
+
+    return encoder.finish()
+
+
+class TimestampColumn:
+
+    def __init__(self, data: bytes):
+        self._data = memoryview(data)
+
+        magic, self.resolution = _STREAM_HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC:
+            raise ValueError('Not an encoded timestamp column')
+
+        self._blocks = []  # type: List[Tuple[int, int, int, int, int]]
+        offset = _STREAM_HEADER.size
+
+        while offset < len(self._data):
+            first, minimum, maximum, count, size = _BLOCK_HEADER.unpack_from(self._data, offset)
+            offset += _BLOCK_HEADER.size
+            self._blocks.append((first, minimum, maximum, count, offset))
+            offset += size
+
+        if offset != len(self._data):
+            raise ValueError('Truncated timestamp column')
+
+    def __len__(self) -> int:
+        return sum(block[3] for block in self._blocks)
+
+    def __iter__(self) -> Iterator[Carbon]:
+        for value in self.iter_epochs():
+            yield Carbon.createFromTimestamp(value / self.resolution)
+
+    def blocks(self) -> List[Tuple[int, int, int]]:
+        return [(minimum, maximum, count) for _, minimum, maximum, count, _ in self._blocks]
+
+    def iter_epochs(self) -> Iterator[int]:
+        for block in self._blocks:
+            yield from self._decode_block(block)
+
+    def to_epoch_array(self) -> array:
+        values = array('q')
+
+        for block in self._blocks:
+            values.extend(self._decode_block(block))
+
+        return values
+
+    def between(self, low: Carbon, high: Carbon, included: bool = True) -> Iterator[Carbon]:
+        low_value = round(low.getTimestamp() * self.resolution)
+        high_value = round(high.getTimestamp() * self.resolution)
+
+        for block in self._blocks:
+            if block[2] < low_value or block[1] > high_value:
+                continue
+
+            for value in self._decode_block(block):
+                if (low_value <= value <= high_value) if included else (low_value < value < high_value):
+                    yield Carbon.createFromTimestamp(value / self.resolution)
+
+    def _decode_block(self, block: Tuple[int, int, int, int, int]) -> Iterator[int]:
+        first, _, _, count, offset = block
+        reader = _BitReader(self._data[offset:])
+        value = first
+        delta = 0
+
+        yield value
+
+        for _ in range(count - 1):
+            delta += self._read_delta_of_delta(reader)
+            value += delta
+
+            yield value
+
+    @staticmethod
+    def _read_delta_of_delta(reader: _BitReader) -> int:
+        if not reader.read(1):
+            return 0
+
+        for _, _, value_bits in _BUCKETS[:-1]:
+            if not reader.read(1):
+                return _unzigzag(reader.read(value_bits))
+
+        return _unzigzag(reader.read(_BUCKETS[-1][2]))
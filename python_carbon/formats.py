@@ -0,0 +1,162 @@
+import re
+from datetime import datetime
+from typing import Callable, Dict, Optional, Pattern
+
+# Compiled patterns and parsers are cached in plain dicts rather than behind a
+# lock or lru_cache: lookups stay lock-free on free-threaded builds, and two
+# threads racing on the same format only compile it twice.
+# Both are emptied once they reach _CACHE_MAX_SIZE entries, as the stdlib
+# strptime cache is, so caller-supplied formats cannot grow them unbounded.
+_CACHE_MAX_SIZE = 100
+
+_patterns = {}  # type: Dict[str, Pattern]
+_parsers = {}  # type: Dict[str, Optional[Callable[[str], datetime]]]
+
+_SEARCH_DIRECTIVES = {
+    'Y': r'\d{4}',
+    'y': r'\d{2}',
+    'm': r'\d{1,2}',
+    'd': r'\d{1,2}',
+    'H': r'\d{1,2}',
+    'I': r'\d{1,2}',
+    'M': r'\d{1,2}',
+    'S': r'\d{1,2}',
+    'f': r'\d{1,6}',
+    'j': r'\d{1,3}',
+    'U': r'\d{1,2}',
+    'W': r'\d{1,2}',
+    'w': r'\d',
+    'u': r'\d',
+    'a': r'[A-Za-z]+',
+    'A': r'[A-Za-z]+',
+    'b': r'[A-Za-z]+',
+    'B': r'[A-Za-z]+',
+    'p': r'[AaPp][Mm]',
+    'z': r'(?:Z|[+-]\d{2}:?\d{2}(?::?\d{2}(?:\.\d{1,6})?)?)',
+    'Z': r'[A-Za-z]+',
+    'T': r'\d{1,2}:\d{1,2}:\d{1,2}',
+    '%': '%',
+}
+
+# Same expressions as the standard library's _strptime, so the fast path
+# accepts exactly the strings datetime.strptime() accepts for these directives.
+_PARSE_DIRECTIVES = {
+    'Y': r'(?P<Y>\d\d\d\d)',
+    'y': r'(?P<y>\d\d)',
+    'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+    'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+    'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+    'M': r'(?P<M>[0-5]\d|\d)',
+    'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    'f': r'(?P<f>[0-9]{1,6})',
+    '%': '%',
+}
+
+
+def _translate(format_string: str, directives: Dict[str, str], whitespace: Optional[str] = None) -> Optional[str]:
+    pattern = []
+    position = 0
+
+    while position < len(format_string):
+        char = format_string[position]
+
+        if char != '%':
+            if whitespace is not None and char.isspace():
+                while position < len(format_string) and format_string[position].isspace():
+                    position += 1
+
+                pattern.append(whitespace)
+                continue
+
+            pattern.append(re.escape(char))
+            position += 1
+            continue
+
+        directive = format_string[position + 1:position + 2]
+        if directive not in directives:
+            return None
+
+        pattern.append(directives[directive])
+        position += 2
+
+    return ''.join(pattern)
+
+
+def compile_format(format_string: str) -> Pattern:
+    pattern = _patterns.get(format_string)
+
+    if pattern is None:
+        translated = _translate(format_string, _SEARCH_DIRECTIVES)
+        if translated is None:
+            raise ValueError('Unsupported format directive in: ' + format_string)
+
+        if len(_patterns) >= _CACHE_MAX_SIZE:
+            _patterns.clear()
+
+        pattern = _patterns[format_string] = re.compile(translated.encode('utf-8'))
+
+    return pattern
+
+
+def compile_parser(format_string: str) -> Optional[Callable[[str], datetime]]:
+    try:
+        return _parsers[format_string]
+    except KeyError:
+        pass
+
+    parser = None
+    translated = _translate(format_string, _PARSE_DIRECTIVES, r'\s+')
+
+    if translated is not None:
+        try:
+            parser = _numeric_parser(format_string, re.compile(translated, re.IGNORECASE))
+        except re.error:
+            parser = None
+
+    if len(_parsers) >= _CACHE_MAX_SIZE:
+        _parsers.clear()
+
+    _parsers[format_string] = parser
+
+    return parser
+
+
+def strptime(date_string: str, format_string: str) -> datetime:
+    parser = compile_parser(format_string)
+
+    if parser is None:
+        return datetime.strptime(date_string, format_string)
+
+    return parser(date_string)
+
+
+def _numeric_parser(format_string: str, pattern: Pattern) -> Callable[[str], datetime]:
+    def parse(date_string: str) -> datetime:
+        found = pattern.match(date_string)
+
+        if found is None:
+            raise ValueError('time data ' + repr(date_string) + ' does not match format ' + repr(format_string))
+
+        if found.end() != len(date_string):
+            raise ValueError('unconverted data remains: ' + date_string[found.end():])
+
+        fields = found.groupdict()
+        year = 1900
+
+        if fields.get('Y') is not None:
+            year = int(fields['Y'])
+        elif fields.get('y') is not None:
+            year = int(fields['y'])
+            year += 2000 if year <= 68 else 1900
+
+        return datetime(
+            year,
+            int(fields.get('m') or 1),
+            int(fields.get('d') or 1),
+            int(fields.get('H') or 0),
+            int(fields.get('M') or 0),
+            int(fields.get('S') or 0),
+            int((fields.get('f') or '0').ljust(6, '0')),
+        )
+
+    return parse
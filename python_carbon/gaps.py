@@ -0,0 +1,145 @@
+from collections import namedtuple
+from datetime import datetime, timedelta
+from itertools import accumulate, islice
+from math import ceil
+from typing import Iterable, Iterator, Sequence, Union
+
+from python_carbon import Carbon
+
+GAP = 'gap'
+DUPLICATE = 'duplicate'
+OUT_OF_ORDER = 'out_of_order'
+
+Discontinuity = namedtuple('Discontinuity', ['kind', 'start', 'end', 'count'])
+
+_FIXED_STEPS = {
+    'seconds': timedelta(seconds=1),
+    'minutes': timedelta(minutes=1),
+    'hours': timedelta(hours=1),
+    'days': timedelta(days=1),
+    'weeks': timedelta(weeks=1),
+}
+
+
+def detect_gaps(stream: Iterable[Carbon], amount: int = 1, unit: str = 'minutes') -> Iterator[Discontinuity]:
+    if amount <= 0:
+        raise ValueError('amount must be positive')
+
+    if not hasattr(Carbon, 'add' + unit.capitalize()):
+        raise ValueError('Unsupported unit: ' + unit)
+
+    step = _FIXED_STEPS.get(unit.lower())
+    step = None if step is None else step * amount
+
+    return _detect_gaps(stream, amount, unit, step)
+
+
+def _detect_gaps(stream: Iterable[Carbon], amount: int, unit: str, step: Union[timedelta, None]) -> Iterator[Discontinuity]:
+    # Expected instants are always derived from an anchor (anchor + n steps)
+    # rather than chained from the previous point, so month and year cadences
+    # keep addMonths() clamping: Jan 31 is followed by Feb 28/29 and Mar 31.
+    anchor = None
+    index = 0
+    last = None
+
+    def expected_at(position: int) -> datetime:
+        if step is not None:
+            return anchor.toDatetime() + step * position
+
+        return anchor.add(amount * position, unit).toDatetime()
+
+    for carbon in stream:
+        current = carbon.toDatetime()
+
+        if last is None:
+            anchor, index, last = carbon, 0, current
+            continue
+
+        if current == last:
+            yield Discontinuity(DUPLICATE, carbon, carbon, 1)
+            continue
+
+        if current < last:
+            yield Discontinuity(OUT_OF_ORDER, carbon, carbon, 1)
+            continue
+
+        expected = expected_at(index + 1)
+
+        if current == expected:
+            index += 1
+            last = current
+            continue
+
+        if current > expected:
+            if step is not None:
+                count = -((expected - current) // step)
+                end = expected + step * (count - 1)
+                following = expected + step * count
+            else:
+                count, end, following = 0, expected, expected
+
+                while following < current:
+                    count += 1
+                    end = following
+                    following = expected_at(index + 1 + count)
+
+            yield Discontinuity(GAP, Carbon(expected), Carbon(end), count)
+
+            if following == current:
+                index += count + 1
+                last = current
+                continue
+
+        anchor, index, last = carbon, 0, current
+
+
+def detect_gaps_epoch(buffer: Sequence[float], step: float) -> Iterator[Discontinuity]:
+    if step <= 0:
+        raise ValueError('step must be positive')
+
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    if numpy is None:
+        return _scan_epoch(buffer, step)
+
+    return _scan_epoch_vectorized(numpy, buffer, step)
+
+
+def _scan_epoch(buffer: Sequence[float], step: float) -> Iterator[Discontinuity]:
+    for previous, current in zip(accumulate(buffer, max), islice(buffer, 1, None)):
+        event = _epoch_event(previous, current, step)
+
+        if event is not None:
+            yield event
+
+
+def _scan_epoch_vectorized(numpy, buffer: Sequence[float], step: float) -> Iterator[Discontinuity]:
+    values = numpy.asarray(buffer)
+
+    if values.size < 2:
+        return
+
+    previous = numpy.maximum.accumulate(values)[:-1]
+    delta = values[1:] - previous
+
+    for position in numpy.flatnonzero((delta <= 0) | (delta > step)).tolist():
+        yield _epoch_event(previous[position].item(), values[position + 1].item(), step)
+
+
+def _epoch_event(previous: float, current: float, step: float) -> Union[Discontinuity, None]:
+    delta = current - previous
+
+    if delta == 0:
+        return Discontinuity(DUPLICATE, current, current, 1)
+
+    if delta < 0:
+        return Discontinuity(OUT_OF_ORDER, current, current, 1)
+
+    if delta > step:
+        count = ceil(delta / step) - 1
+        return Discontinuity(GAP, previous + step, previous + step * count, count)
+
+    return None
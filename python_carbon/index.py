@@ -0,0 +1,92 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from python_carbon import Carbon
+
+_RESOLUTION = 1_000_000
+
+
+def _to_key(carbon: Carbon) -> int:
+    return round(carbon.getTimestamp() * _RESOLUTION)
+
+
+def _to_carbon(key: int) -> Carbon:
+    return Carbon.createFromTimestamp(key / _RESOLUTION)
+
+
+class TimeIndex:
+
+    # Keys are epoch microseconds in a flat array('q'), so an entry costs
+    # eight bytes plus a pointer to its value instead of a Carbon and a datetime.
+
+    def __init__(self, items: Optional[Iterable[Tuple[Carbon, Any]]] = None):
+        self._keys = array('q')
+        self._values = []  # type: List[Any]
+
+        if items is not None:
+            self.load(items)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[Tuple[Carbon, Any]]:
+        for key, value in zip(self._keys, self._values):
+            yield _to_carbon(key), value
+
+    ###########
+    # Loading #
+    ###########
+
+    def add(self, carbon: Carbon, value: Any) -> None:
+        key = _to_key(carbon)
+
+        if not self._keys or key >= self._keys[-1]:
+            self._keys.append(key)
+            self._values.append(value)
+            return
+
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._values.insert(position, value)
+
+    def load(self, items: Iterable[Tuple[Carbon, Any]]) -> None:
+        pairs = sorted(((_to_key(carbon), value) for carbon, value in items), key=itemgetter(0))
+
+        if self._keys and pairs and pairs[0][0] < self._keys[-1]:
+            pairs = sorted(chain(zip(self._keys, self._values), pairs), key=itemgetter(0))
+            self._keys = array('q')
+            self._values = []
+
+        self._keys.extend(pair[0] for pair in pairs)
+        self._values.extend(pair[1] for pair in pairs)
+
+    ###########
+    # Queries #
+    ###########
+
+    def between(self, low: Carbon, high: Carbon, included: bool = True) -> List[Any]:
+        return self.betweenIncluded(low, high) if included else self.betweenExcluded(low, high)
+
+    def betweenIncluded(self, low: Carbon, high: Carbon) -> List[Any]:
+        return self._values[bisect_left(self._keys, _to_key(low)):bisect_right(self._keys, _to_key(high))]
+
+    def betweenExcluded(self, low: Carbon, high: Carbon) -> List[Any]:
+        return self._values[bisect_right(self._keys, _to_key(low)):bisect_left(self._keys, _to_key(high))]
+
+    def within(self, carbon: Carbon, unit: str) -> List[Any]:
+        return self.betweenIncluded(carbon.startOf(unit), carbon.endOf(unit))
+
+    def before(self, carbon: Carbon, included: bool = False) -> Optional[Tuple[Carbon, Any]]:
+        key = _to_key(carbon)
+        position = (bisect_right(self._keys, key) if included else bisect_left(self._keys, key)) - 1
+
+        return None if position < 0 else (_to_carbon(self._keys[position]), self._values[position])
+
+    def after(self, carbon: Carbon, included: bool = False) -> Optional[Tuple[Carbon, Any]]:
+        key = _to_key(carbon)
+        position = bisect_left(self._keys, key) if included else bisect_right(self._keys, key)
+
+        return None if position >= len(self._keys) else (_to_carbon(self._keys[position]), self._values[position])
@@ -0,0 +1,122 @@
+import re
+from datetime import datetime
+from typing import Optional, Tuple, Union
+from dateutil.parser import parse as date_parser
+
+from python_carbon import Carbon
+from python_carbon.formats import _CACHE_MAX_SIZE, strptime
+
+# Fields whose zero-padded text sorts in chronological order when they appear
+# in this order, most significant first.
+_ORDERED_FIELDS = (('Y', 4), ('m', 2), ('d', 2), ('H', 2), ('M', 2), ('S', 2), ('f', 6))
+_DIRECTIVE = re.compile(r'%(.)')
+_ISO_LAYOUT = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?')
+_DIGIT = re.compile(r'\d')
+
+_masks = {}
+
+
+def _ordered_mask(format_string: str) -> Optional[str]:
+    try:
+        return _masks[format_string]
+    except KeyError:
+        pass
+
+    directives = _DIRECTIVE.findall(format_string)
+    widths = dict(_ORDERED_FIELDS[:len(directives)])
+    mask = None
+
+    # Every field is zero-padded in the mask, so only raw strings whose fields
+    # are all digits (no space-padded days or hours) compare as text.
+    if directives and tuple(directives) == tuple(widths):
+        mask = _DIGIT.sub('0', _DIRECTIVE.sub(lambda directive: '0' * widths[directive.group(1)], format_string))
+
+    if len(_masks) >= _CACHE_MAX_SIZE:
+        _masks.clear()
+
+    _masks[format_string] = mask
+
+    return mask
+
+
+def _layout(carbon: 'LazyCarbon') -> Optional[Tuple[str, str]]:
+    raw, format_string = carbon.getRaw(), carbon.getFormat()
+
+    if format_string is not None:
+        mask = _ordered_mask(format_string)
+        return ('format', format_string) if mask is not None and _DIGIT.sub('0', raw) == mask else None
+
+    if _ISO_LAYOUT.fullmatch(raw):
+        return 'iso', _DIGIT.sub('0', raw)
+
+    return None
+
+
+class LazyCarbon(Carbon):
+
+    def __init__(self, raw: Union[str, bytes], format_string: Optional[str] = None):  # pylint: disable=super-init-not-called
+        self._raw = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+        self._format = format_string
+        self._parsed = None  # type: Optional[datetime]
+
+    @property
+    def _date(self) -> datetime:
+        if self._parsed is None:
+            self._parsed = date_parser(self._raw) if self._format is None else strptime(self._raw, self._format)
+
+        return self._parsed
+
+    def isParsed(self) -> bool:
+        return self._parsed is not None
+
+    def getRaw(self) -> str:
+        return self._raw
+
+    def getFormat(self) -> Optional[str]:
+        return self._format
+
+    ##############
+    # Comparison #
+    ##############
+
+    def equalTo(self, carbon: 'Carbon') -> bool:
+        if isinstance(carbon, LazyCarbon) and carbon.getFormat() == self._format and carbon.getRaw() == self._raw:
+            return True
+
+        if self._shares_layout(carbon):
+            return False
+
+        return super().equalTo(carbon)
+
+    def notEqualTo(self, carbon: 'Carbon') -> bool:
+        return not self.equalTo(carbon)
+
+    def greaterThan(self, carbon: 'Carbon') -> bool:
+        return self._raw > carbon.getRaw() if self._shares_layout(carbon) else super().greaterThan(carbon)
+
+    def greaterThanOrEqualTo(self, carbon: 'Carbon') -> bool:
+        return self._raw >= carbon.getRaw() if self._shares_layout(carbon) else super().greaterThanOrEqualTo(carbon)
+
+    def lessThan(self, carbon: 'Carbon') -> bool:
+        return self._raw < carbon.getRaw() if self._shares_layout(carbon) else super().lessThan(carbon)
+
+    def lessThanOrEqualTo(self, carbon: 'Carbon') -> bool:
+        return self._raw <= carbon.getRaw() if self._shares_layout(carbon) else super().lessThanOrEqualTo(carbon)
+
+    def betweenIncluded(self, low: 'Carbon', high: 'Carbon') -> bool:
+        return self.greaterThanOrEqualTo(low) and self.lessThanOrEqualTo(high)
+
+    def betweenExcluded(self, low: 'Carbon', high: 'Carbon') -> bool:
+        return self.greaterThan(low) and self.lessThan(high)
+
+    ############
+    # Internal #
+    ############
+
+    def _shares_layout(self, carbon: 'Carbon') -> bool:
+        if not isinstance(carbon, LazyCarbon):
+            return False
+
+        layout = _layout(self)
+
+        return layout is not None and layout == _layout(carbon)
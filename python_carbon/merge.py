@@ -0,0 +1,83 @@
+from heapq import heapify, heappop, heappush, heapreplace
+from itertools import count
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+TIE_BREAK_STREAM = 'stream'
+TIE_BREAK_REVERSE = 'reverse'
+
+
+def merge(
+    *streams: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    tie_break: Union[str, Callable[[Any], Any]] = TIE_BREAK_STREAM,
+    dedup: bool = False,
+    lookahead: int = 0,
+) -> Iterator[Any]:
+    if lookahead < 0:
+        raise ValueError('lookahead must be zero or positive')
+
+    if tie_break not in (TIE_BREAK_STREAM, TIE_BREAK_REVERSE) and not callable(tie_break):
+        raise ValueError('Unsupported tie break policy: ' + str(tie_break))
+
+    return _merge(streams, key, tie_break, dedup, lookahead)
+
+
+def _merge(
+    streams: tuple,
+    key: Optional[Callable[[Any], Any]],
+    tie_break: Union[str, Callable[[Any], Any]],
+    dedup: bool,
+    lookahead: int,
+) -> Iterator[Any]:
+    def instant(item: Any) -> float:
+        return (item if key is None else key(item)).getTimestamp()
+
+    def rank(item: Any, index: int) -> Any:
+        if tie_break == TIE_BREAK_STREAM:
+            return index
+
+        if tie_break == TIE_BREAK_REVERSE:
+            return -index
+
+        return tie_break(item)
+
+    sequence = count()
+    heap = []
+
+    for index, stream in enumerate(streams):
+        iterator = iter(stream) if not lookahead else _reorder(stream, instant, lookahead)
+
+        for item in iterator:
+            heap.append((instant(item), rank(item, index), next(sequence), item, index, iterator))
+            break
+
+    heapify(heap)
+    last = None
+
+    while heap:
+        timestamp, _, _, item, index, iterator = heap[0]
+
+        if not dedup or last is None or timestamp != last:
+            yield item
+
+        last = timestamp
+
+        for following in iterator:
+            heapreplace(heap, (instant(following), rank(following, index), next(sequence), following, index, iterator))
+            break
+        else:
+            heappop(heap)
+
+
+def _reorder(stream: Iterable[Any], instant: Callable[[Any], float], lookahead: int) -> Iterator[Any]:
+    sequence = count()
+    window = []
+
+    for item in stream:
+        heappush(window, (instant(item), next(sequence), item))
+
+        if len(window) > lookahead:
+            yield heappop(window)[2]
+
+    while window:
+        yield heappop(window)[2]
@@ -0,0 +1,139 @@
+import re
+from typing import Callable, Tuple
+
+from python_carbon import Carbon
+from python_carbon.formats import _CACHE_MAX_SIZE
+
+Operation = Tuple[Callable[..., Carbon], tuple]
+
+# Compiled expressions are cached in a plain dict, like the format parsers,
+# so lookups stay lock-free on free-threaded builds, and emptied at the same
+# size so caller-supplied expressions cannot grow it unbounded.
+_compiled = {}
+
+_UNITS = {
+    'sec': 'Seconds',
+    'second': 'Seconds',
+    'min': 'Minutes',
+    'minute': 'Minutes',
+    'hour': 'Hours',
+    'day': 'Days',
+    'week': 'Weeks',
+    'month': 'Months',
+    'year': 'Years',
+}
+
+_WEEKDAYS = {
+    'monday': Carbon.MONDAY,
+    'tuesday': Carbon.TUESDAY,
+    'wednesday': Carbon.WEDNESDAY,
+    'thursday': Carbon.THURSDAY,
+    'friday': Carbon.FRIDAY,
+    'saturday': Carbon.SATURDAY,
+    'sunday': Carbon.SUNDAY,
+}
+
+_UNIT = r'(second|sec|minute|min|hour|day|week|month|year)s?'
+_BOUNDARY_UNIT = r'(second|minute|hour|day|week|month|year)'
+_RELATIVE = r'(this|next|last|previous)'
+
+_TOKENS = re.compile('(?:' + '|'.join([
+    r'(?P<day_of>first|last) day of (?:' + _RELATIVE + r' )?(month|year)',
+    r'(?P<boundary>start|end) of (?:the )?(?:' + _RELATIVE + r' )?' + _BOUNDARY_UNIT,
+    r'(?P<weekday>next|last|previous) (' + '|'.join(_WEEKDAYS) + r')',
+    r'(?P<relative>next|last|previous) ' + _BOUNDARY_UNIT,
+    r'(?P<amount>[+-]?) ?(\d+) ?' + _UNIT + r'(?P<ago> ago)?',
+    r'(?P<keyword>now|today|midnight|noon|tomorrow|yesterday)',
+]) + r')(?![a-z])')
+
+_KEYWORDS = {
+    'now': (),
+    'today': ((Carbon.startOfDay, ()),),
+    'midnight': ((Carbon.startOfDay, ()),),
+    'noon': ((Carbon.startOfDay, ()), (Carbon.addHours, (12,))),
+    'tomorrow': ((Carbon.addDays, (1,)), (Carbon.startOfDay, ())),
+    'yesterday': ((Carbon.subDays, (1,)), (Carbon.startOfDay, ())),
+}
+
+
+def compile_modifier(expression: str) -> Tuple[Operation, ...]:
+    try:
+        return _compiled[expression]
+    except KeyError:
+        pass
+
+    normalized = ' '.join(expression.lower().split())
+    operations = []
+    position = 0
+
+    while position < len(normalized):
+        if normalized[position] == ' ':
+            position += 1
+            continue
+
+        token = _TOKENS.match(normalized, position)
+        if token is None:
+            raise ValueError('Unsupported modifier: ' + normalized[position:])
+
+        operations.extend(_compile_token(token))
+        position = token.end()
+
+    if len(_compiled) >= _CACHE_MAX_SIZE:
+        _compiled.clear()
+
+    compiled = _compiled[expression] = tuple(operations)
+
+    return compiled
+
+
+def apply_modifier(carbon: Carbon, operations: Tuple[Operation, ...]) -> Carbon:
+    for method, args in operations:
+        carbon = method(carbon, *args)
+
+    return carbon
+
+
+def _next_weekday(carbon: Carbon, weekday: int) -> Carbon:
+    return carbon.addDays((weekday - carbon.getDayOfWeek() - 1) % 7 + 1)
+
+
+def _last_weekday(carbon: Carbon, weekday: int) -> Carbon:
+    return carbon.subDays((carbon.getDayOfWeek() - weekday - 1) % 7 + 1)
+
+
+def _shift(relative: str, unit: str) -> Tuple[Operation, ...]:
+    if relative in (None, 'this'):
+        return ()
+
+    prefix = 'add' if relative == 'next' else 'sub'
+
+    return ((getattr(Carbon, prefix + _UNITS[unit]), (1,)),)
+
+
+def _compile_token(token) -> Tuple[Operation, ...]:
+    kind = next(name for name in ('day_of', 'boundary', 'weekday', 'relative', 'amount', 'keyword') if token.group(name) is not None)
+    groups = token.groups()[token.re.groupindex[kind] - 1:]
+
+    if kind == 'day_of':
+        edge, relative, unit = groups[:3]
+        boundary = 'startOf' if edge == 'first' else 'endOf'
+        return _shift(relative, unit) + ((getattr(Carbon, boundary + unit.capitalize()), ()),)
+
+    if kind == 'boundary':
+        edge, relative, unit = groups[:3]
+        return _shift(relative, unit) + ((getattr(Carbon, edge + 'Of' + unit.capitalize()), ()),)
+
+    if kind == 'weekday':
+        relative, weekday = groups[:2]
+        return (((_next_weekday if relative == 'next' else _last_weekday), (_WEEKDAYS[weekday],)),)
+
+    if kind == 'relative':
+        relative, unit = groups[:2]
+        return _shift(relative, unit)
+
+    if kind == 'amount':
+        sign, amount, unit, ago = groups[:4]
+        prefix = 'sub' if (sign == '-') != (ago is not None) else 'add'
+        return ((getattr(Carbon, prefix + _UNITS[unit]), (int(amount),)),)
+
+    return _KEYWORDS[groups[0]]
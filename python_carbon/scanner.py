@@ -0,0 +1,138 @@
+import mmap
+import re
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+from dateutil.tz import tzoffset, tzutc
+
+from python_carbon import Carbon
+from python_carbon.formats import compile_format
+
+
+_ISO_PATTERN = re.compile(
+    rb'(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})[T ]'
+    rb'(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})'
+    rb'(?:[.,](?P<fraction>\d{1,6})\d*)?'
+    rb'(?P<tz>Z|[+-]\d{2}:?\d{2})?'
+)
+
+
+def _from_iso_match(match) -> Carbon:
+    fraction = match.group('fraction') or b'0'
+    tz = match.group('tz')
+    tzinfo = None
+
+    if tz == b'Z':
+        tzinfo = tzutc()
+    elif tz is not None:
+        sign = -1 if tz[:1] == b'-' else 1
+        digits = tz[1:].replace(b':', b'')
+        tzinfo = tzoffset(None, sign * (int(digits[:2]) * 3600 + int(digits[2:]) * 60))
+
+    return Carbon(datetime(
+        int(match.group('year')),
+        int(match.group('month')),
+        int(match.group('day')),
+        int(match.group('hour')),
+        int(match.group('minute')),
+        int(match.group('second')),
+        int(fraction.ljust(6, b'0')),
+        tzinfo,
+    ))
+
+
+class LogScanner:
+
+    def __init__(self, path: str, format_string: Optional[str] = None):
+        self.path = path
+        self.format_string = format_string
+
+        self._pattern = _ISO_PATTERN if format_string is None else compile_format(format_string)
+        self._file = open(path, 'rb')  # pylint: disable=consider-using-with
+        self._size = self._file.seek(0, 2)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self._size else None
+
+    def __enter__(self) -> 'LogScanner':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Tuple[int, Carbon]]:
+        return self.scan()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        self._file.close()
+
+    def scan(self, start: Optional[Carbon] = None) -> Iterator[Tuple[int, Carbon]]:
+        offset = 0 if start is None else self.seek(start)
+
+        while True:
+            found = self._next_stamped_line(offset)
+            if found is None:
+                return
+
+            yield found[0], found[1]
+            offset = found[2]
+
+    def seek(self, carbon: Carbon) -> int:
+        low, high = 0, self._size
+
+        while low < high:
+            middle = (low + high) // 2
+            found = self._next_stamped_line(self._line_start(middle))
+
+            if found is None or found[1].greaterThanOrEqualTo(carbon):
+                high = middle
+            else:
+                low = middle + 1
+
+        found = self._next_stamped_line(self._line_start(low))
+
+        return self._size if found is None else found[0]
+
+    ############
+    # Internal #
+    ############
+
+    def _line_start(self, offset: int) -> int:
+        if offset == 0 or offset >= self._size:
+            return min(offset, self._size)
+
+        if self._map[offset - 1] == 0x0A:
+            return offset
+
+        end = self._map.find(b'\n', offset)
+
+        return self._size if end == -1 else end + 1
+
+    def _next_stamped_line(self, offset: int) -> Optional[Tuple[int, Carbon, int]]:
+        while offset < self._size:
+            end = self._map.find(b'\n', offset)
+            end = self._size if end == -1 else end
+            position = offset
+
+            # The search pattern is looser than the parser, so text that only
+            # looks like a timestamp is skipped instead of ending the scan.
+            while True:
+                match = self._pattern.search(self._map, position, end)
+                if match is None:
+                    break
+
+                try:
+                    return offset, self._to_carbon(match), end + 1
+                except ValueError:
+                    position = match.start() + 1
+
+            offset = end + 1
+
+        return None
+
+    def _to_carbon(self, match) -> Carbon:
+        if self.format_string is None:
+            return _from_iso_match(match)
+
+        return Carbon.createFromFormat(self.format_string, match.group().decode('utf-8'))
@@ -0,0 +1,144 @@
+import struct
+from array import array
+from calendar import monthrange
+from datetime import date
+from multiprocessing import shared_memory
+from typing import Optional
+
+from python_carbon import Carbon
+
+MAGIC = b'CRBNSHM1'
+
+# magic, table version, kind, item typecode, item count
+_HEADER = struct.Struct('<8sI16s1s3xQ')
+
+
+def _open(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # pylint: disable=unexpected-keyword-arg
+    except TypeError:
+        # Before Python 3.13 attaching always registers the segment with the
+        # resource tracker of the attaching process (see the README).
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedTable:
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool = False):
+        magic, version, kind, typecode, count = _HEADER.unpack_from(memory.buf, 0)
+
+        if magic != MAGIC:
+            memory.close()
+            raise ValueError('Shared memory segment is not a Carbon table: ' + memory.name)
+
+        self.name = memory.name
+        self.version = version
+        self.kind = kind.rstrip(b'\0').decode('ascii')
+        typecode = typecode.decode('ascii')
+        size = count * array(typecode).itemsize
+        self.view = memory.buf[_HEADER.size:_HEADER.size + size].cast(typecode)
+
+        self._memory = memory
+        self._owner = owner
+
+    def __enter__(self) -> 'SharedTable':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+        if self._owner:
+            self.unlink()
+
+    @staticmethod
+    def publish(name: Optional[str], kind: str, values: array, version: int = 1) -> 'SharedTable':
+        size = _HEADER.size + len(values) * values.itemsize
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        _HEADER.pack_into(memory.buf, 0, MAGIC, version, kind.encode('ascii'), values.typecode.encode('ascii'), len(values))
+        memory.buf[_HEADER.size:size] = values.tobytes()
+
+        return SharedTable(memory, owner=True)
+
+    @staticmethod
+    def attach(name: str, kind: Optional[str] = None, version: Optional[int] = None) -> 'SharedTable':
+        table = SharedTable(_open(name))
+
+        if (kind is not None and table.kind != kind) or (version is not None and table.version != version):
+            table.close()
+            raise ValueError('Shared table ' + name + ' is ' + table.kind + ' version ' + str(table.version))
+
+        return table
+
+    def close(self) -> None:
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+            self._memory.close()
+
+    def unlink(self) -> None:
+        self._memory.unlink()
+
+
+class CalendarTable:
+
+    KIND = 'calendar'
+
+    # values[0] is the first year, followed by one record per month.
+    _FIELDS = 3  # days in month, weekday of the 1st, ordinal of the 1st
+
+    def __init__(self, values, shared: Optional[SharedTable] = None):
+        self.values = values
+        self.first_year = values[0]
+        self.last_year = self.first_year + (len(values) - 1) // (12 * self._FIELDS) - 1
+        self.shared = shared
+
+    @staticmethod
+    def build(first_year: int = 1900, last_year: int = 2100) -> 'CalendarTable':
+        if not 1 <= first_year <= last_year <= 9999:
+            raise ValueError
+
+        values = array('q', [first_year])
+
+        for year in range(first_year, last_year + 1):
+            for month in range(1, 13):
+                first_weekday, days = monthrange(year, month)
+                values.extend((days, first_weekday, date(year, month, 1).toordinal()))
+
+        return CalendarTable(values)
+
+    @staticmethod
+    def attach(name: str, version: Optional[int] = None) -> 'CalendarTable':
+        shared = SharedTable.attach(name, CalendarTable.KIND, version)
+
+        return CalendarTable(shared.view, shared)
+
+    def publish(self, name: Optional[str] = None, version: int = 1) -> SharedTable:
+        values = self.values if isinstance(self.values, array) else array('q', self.values)
+
+        return SharedTable.publish(name, self.KIND, values, version)
+
+    def close(self) -> None:
+        if self.shared is not None:
+            self.values = None
+            self.shared.close()
+
+    def getDaysInMonth(self, carbon: Carbon) -> int:
+        return self._field(carbon, 0)
+
+    def getMonthFirstWeekDay(self, carbon: Carbon) -> int:
+        return self._field(carbon, 1)
+
+    def getWeekOfMonth(self, carbon: Carbon, start: int = 0) -> int:
+        return (carbon.getDay() - 1 + self._field(carbon, 1)) // 7 + start
+
+    def getDayKey(self, carbon: Carbon) -> int:
+        return self._field(carbon, 2) + carbon.getDay() - 1
+
+    def _field(self, carbon: Carbon, field: int) -> int:
+        year = carbon.getYear()
+
+        if not self.first_year <= year <= self.last_year:
+            raise ValueError('Year ' + str(year) + ' is outside the calendar table')
+
+        return self.values[1 + ((year - self.first_year) * 12 + carbon.getMonth() - 1) * self._FIELDS + field]
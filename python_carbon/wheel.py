@@ -0,0 +1,287 @@
+import asyncio
+import math
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from python_carbon import Carbon
+
+
+class TimerHandle:
+
+    __slots__ = ('when', 'tick', 'callback', 'args', 'cancelled', 'bucket', '_wheel')
+
+    def __init__(self, wheel: 'TimerWheel', when: float, tick: int, callback: Callable, args: tuple):
+        self.when = when
+        self.tick = tick
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.bucket = None  # type: Optional[Dict[TimerHandle, None]]
+        self._wheel = wheel
+
+    def cancel(self) -> None:
+        self._wheel.cancel(self)
+
+
+class TimerWheel:
+
+    def __init__(
+        self,
+        resolution: float = 0.001,
+        slots: int = 256,
+        levels: int = 4,
+        clock: Callable[[], float] = time.time,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        if resolution <= 0 or slots < 2 or levels < 1:
+            raise ValueError
+
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self.clock = clock
+
+        self._loop = loop
+        self._bound = loop is not None
+        self._spans = [slots ** level for level in range(levels + 1)]
+        self._wheels = [[{} for _ in range(slots)] for _ in range(levels)]
+        self._counts = [0] * levels
+        self._layout = [(level, self._spans[level + 1], self._spans[level], self._wheels[level]) for level in range(levels)]
+        self._overflow = {}  # type: Dict[TimerHandle, None]
+        self._current = self._to_tick(clock())
+        self._wakeup = None  # type: Optional[asyncio.TimerHandle]
+        self._wakeup_tick = None  # type: Optional[int]
+
+    def __len__(self) -> int:
+        return sum(self._counts) + len(self._overflow)
+
+    ##############
+    # Scheduling #
+    ##############
+
+    def call_at(self, carbon: 'Carbon', callback: Callable, *args: Any) -> TimerHandle:
+        return self.call_at_timestamp(carbon.getTimestamp(), callback, *args)
+
+    def call_at_timestamp(self, timestamp: float, callback: Callable, *args: Any) -> TimerHandle:
+        tick = max(math.ceil(timestamp / self.resolution), self._current + 1)
+        handle = TimerHandle(self, timestamp, tick, callback, args)
+        self._link(handle)
+
+        if self._get_loop(required=False) is None:
+            return handle
+
+        # A pending wakeup at or before this tick already covers the handle.
+        # Without one, timers linked before a loop was running may be earlier.
+        if self._wakeup_tick is None:
+            self._schedule_wakeup()
+        elif tick < self._wakeup_tick:
+            self._schedule_wakeup(tick)
+
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> None:
+        if handle.cancelled:
+            return
+
+        handle.cancelled = True
+
+        if handle.bucket is not None:
+            self._unlink(handle)
+
+    async def sleep_until(self, carbon: 'Carbon') -> None:
+        future = self._get_loop().create_future()
+        handle = self.call_at(carbon, _resolve, future)
+
+        try:
+            await future
+        finally:
+            handle.cancel()
+
+    ###########
+    # Driving #
+    ###########
+
+    def advance(self, now: Optional[float] = None) -> int:
+        target = self._to_tick(self.clock() if now is None else now)
+        fired = 0
+        errors = []
+
+        while self._current < target:
+            tick = self._next_interesting_tick(target)
+            self._current = tick
+            self._cascade(tick)
+
+            bucket = self._wheels[0][tick % self.slots]
+            if not bucket:
+                continue
+
+            batch = list(bucket)
+            bucket.clear()
+            self._counts[0] -= len(batch)
+
+            for handle in batch:
+                handle.bucket = None
+
+            for handle in batch:
+                if handle.cancelled:
+                    continue
+
+                try:
+                    handle.callback(*handle.args)
+                except Exception as error:
+                    if self._loop is None:
+                        errors.append(error)
+                    else:
+                        self._loop.call_exception_handler({
+                            'message': 'Exception in TimerWheel callback',
+                            'exception': error,
+                            'handle': handle,
+                        })
+
+                fired += 1
+
+        if errors:
+            raise errors[0]
+
+        return fired
+
+    def next_deadline(self) -> Optional[float]:
+        tick = self._next_wakeup_tick()
+
+        return None if tick is None else tick * self.resolution
+
+    ############
+    # Internal #
+    ############
+
+    def _to_tick(self, timestamp: float) -> int:
+        return int(timestamp // self.resolution)
+
+    def _get_loop(self, required: bool = True) -> Optional[asyncio.AbstractEventLoop]:
+        # A loop found at run time is dropped once it closes, so the wheel can
+        # be reused under a later asyncio.run().
+        if self._loop is not None and not self._bound and self._loop.is_closed():
+            self._loop = None
+            self._wakeup = None
+            self._wakeup_tick = None
+
+        if self._loop is None:
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                if required:
+                    raise
+
+        return self._loop
+
+    def _link(self, handle: TimerHandle) -> None:
+        tick = handle.tick
+        current = self._current
+
+        for level, span, unit, wheel in self._layout:
+            if tick // span == current // span:
+                bucket = wheel[(tick // unit) % self.slots]
+                self._counts[level] += 1
+                break
+        else:
+            bucket = self._overflow
+
+        bucket[handle] = None
+        handle.bucket = bucket
+
+    def _unlink(self, handle: TimerHandle) -> None:
+        bucket = handle.bucket
+        del bucket[handle]
+        handle.bucket = None
+
+        if bucket is not self._overflow:
+            for level in range(self.levels):
+                if bucket is self._wheels[level][(handle.tick // self._spans[level]) % self.slots]:
+                    self._counts[level] -= 1
+                    break
+
+        if not self:
+            self._cancel_wakeup()
+
+    def _relink(self, bucket: Dict[TimerHandle, None]) -> None:
+        handles = list(bucket)
+        bucket.clear()
+
+        for handle in handles:
+            self._link(handle)
+
+    def _cascade(self, tick: int) -> None:
+        if tick % self._spans[self.levels] == 0 and self._overflow:
+            self._relink(self._overflow)
+
+        for level in range(self.levels - 1, 0, -1):
+            if tick % self._spans[level] != 0:
+                continue
+
+            bucket = self._wheels[level][(tick // self._spans[level]) % self.slots]
+            if bucket:
+                self._counts[level] -= len(bucket)
+                self._relink(bucket)
+
+    def _next_interesting_tick(self, target: int) -> int:
+        tick = self._current + 1
+
+        # Empty lower levels cannot fire before the next boundary of the
+        # first populated level, so jump straight to it.
+        for level in range(self.levels):
+            if self._counts[level]:
+                break
+
+            span = self._spans[level + 1]
+            tick = (self._current // span + 1) * span
+
+        return min(tick, target)
+
+    def _next_wakeup_tick(self) -> Optional[int]:
+        if not self:
+            return None
+
+        if self._counts[0]:
+            end = (self._current // self.slots + 1) * self.slots
+
+            for tick in range(self._current + 1, end):
+                if self._wheels[0][tick % self.slots]:
+                    return tick
+
+            return end
+
+        return self._next_interesting_tick(self._current + self._spans[self.levels])
+
+    def _schedule_wakeup(self, tick: Optional[int] = None) -> None:
+        loop = self._get_loop(required=False)
+        if loop is None:
+            return
+
+        if tick is None:
+            tick = self._next_wakeup_tick()
+
+        if tick is None or tick == self._wakeup_tick:
+            return
+
+        self._cancel_wakeup()
+        self._wakeup_tick = tick
+        self._wakeup = loop.call_later(max(0.0, tick * self.resolution - self.clock()), self._on_wakeup)
+
+    def _cancel_wakeup(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+
+        self._wakeup = None
+        self._wakeup_tick = None
+
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        self._wakeup_tick = None
+        self.advance()
+        self._schedule_wakeup()
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
@@ -19,6 +19,9 @@ setup(
     install_requires=[
         'python-dateutil>=2'
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
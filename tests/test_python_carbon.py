@@ -1,6 +1,19 @@
+import asyncio
+import os
+import tempfile
+import time
 import unittest
 from datetime import datetime, timedelta
-from python_carbon import Carbon
+from python_carbon import formats, gaps, lazy, modifiers
+from python_carbon import (
+    CalendarTable, Carbon, CarbonDate, LogScanner, SharedTable, TimeIndex, TimerWheel, TimestampColumn, TimestampEncoder,
+    detect_gaps, detect_gaps_epoch, encode, merge,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class test_python_carbon(unittest.TestCase):
@@ -205,6 +218,415 @@ class test_python_carbon(unittest.TestCase):
         self.assertTrue(base.nextSaturday().equalTo(base.next(Carbon.SATURDAY)))
         self.assertTrue(base.nextSunday().equalTo(base.next(Carbon.SUNDAY)))
 
+    def test_timer_wheel_with_virtual_clock(self) -> None:
+        clock = [Carbon.parse('2021-08-18 12:00:00').getTimestamp()]
+        wheel = TimerWheel(resolution=1, slots=4, levels=2, clock=lambda: clock[0])
+        base = Carbon.parse('2021-08-18 12:00:00')
+        fired = []
+
+        for seconds in [90, 5, 5, 30, 1000]:
+            wheel.call_at(base.addSeconds(seconds), fired.append, seconds)
+
+        cancelled = wheel.call_at(base.addSeconds(30), fired.append, 'cancelled')
+        cancelled.cancel()
+        self.assertEqual(len(wheel), 5)
+
+        self.assertEqual(wheel.advance(clock[0] + 4), 0)
+        self.assertEqual(wheel.advance(clock[0] + 5), 2)
+        self.assertEqual(fired, [5, 5])
+
+        clock[0] += 100
+        self.assertEqual(wheel.advance(), 2)
+        self.assertEqual(fired, [5, 5, 30, 90])
+        self.assertLessEqual(wheel.next_deadline(), base.addSeconds(1000).getTimestamp())
+
+        clock[0] += 900
+        wheel.advance()
+        self.assertEqual(fired, [5, 5, 30, 90, 1000])
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_deadline())
+
+    def test_timer_wheel_sleep_until(self) -> None:
+        clock = [0.0]
+        wheel = TimerWheel(resolution=0.5, clock=lambda: clock[0])
+
+        async def scenario() -> bool:
+            sleeper = asyncio.ensure_future(wheel.sleep_until(Carbon.createFromTimestamp(10)))
+            await asyncio.sleep(0)
+            self.assertFalse(sleeper.done())
+
+            clock[0] = 10.0
+            wheel.advance()
+            await sleeper
+
+            return sleeper.done()
+
+        self.assertTrue(asyncio.run(scenario()))
+
+    def test_timer_wheel_across_event_loops(self) -> None:
+        wheel = TimerWheel()
+        fired = []
+        wheel.call_at_timestamp(time.time() + 0.05, fired.append, 'before loop')
+
+        async def first() -> None:
+            wheel.call_at_timestamp(time.time() + 5, fired.append, 'later')
+            await asyncio.sleep(0.2)
+
+        asyncio.run(first())
+        self.assertEqual(fired, ['before loop'])
+
+        async def second() -> None:
+            await wheel.sleep_until(Carbon.createFromTimestamp(time.time() + 0.02))
+            fired.append('second loop')
+
+        asyncio.run(asyncio.wait_for(second(), 1))
+        self.assertEqual(fired, ['before loop', 'second loop'])
+
+    def test_log_scanner_iteration_and_seek(self) -> None:
+        base = Carbon.parse('2021-08-18 00:00:00')
+        lines = []
+
+        for i in range(50):
+            lines.append('GET /' + str(i) + ' [' + base.addMinutes(i).format('%d/%b/%Y:%H:%M:%S') + ']')
+            lines.append('    continuation without timestamp')
+
+        lines.append('build 12/Foo/2021:12:34:56')
+        with tempfile.NamedTemporaryFile('w', suffix='.log', delete=False) as handle:
+            handle.write('\n'.join(lines))
+
+        try:
+            with LogScanner(handle.name, '%d/%b/%Y:%H:%M:%S') as scanner:
+                entries = list(scanner)
+                self.assertEqual(len(entries), 50)
+                self.assertEqual(entries[0][0], 0)
+                self.assertEqual(entries[3][1].toDateTimeString(), '2021-08-18 00:03:00')
+
+                offset = scanner.seek(base.addMinutes(10).addSeconds(30))
+                self.assertEqual(offset, entries[11][0])
+                self.assertEqual(scanner.seek(base.subDays(1)), 0)
+                self.assertEqual(scanner.seek(base.addDays(1)), os.path.getsize(handle.name))
+
+                first = next(scanner.scan(base.addMinutes(20)))
+                self.assertEqual(first[1].toDateTimeString(), '2021-08-18 00:20:00')
+
+            with open(handle.name, 'w', encoding='utf-8') as iso:
+                iso.write('build 9999-99-99 12:34:56\n2021-08-18T10:00:00.5Z started\n')
+                iso.write('build 9999-99-99 12:34:56 then 2021-08-18 12:00:01+02:00 done\n')
+
+            with LogScanner(handle.name) as scanner:
+                stamps = [carbon.utc().toDateTimeString(with_milliseconds=True) for _, carbon in scanner]
+                self.assertEqual(stamps, ['2021-08-18 10:00:00.500000', '2021-08-18 10:00:01.000000'])
+        finally:
+            os.unlink(handle.name)
+
+    def test_merge_streams_in_time_order(self) -> None:
+        base = Carbon.parse('2021-08-18 00:00:00')
+        first = [base.addSeconds(seconds) for seconds in [0, 2, 4, 6]]
+        second = [base.addSeconds(seconds) for seconds in [1, 2, 3]]
+
+        merged = [carbon.getSecond() for carbon in merge(first, second)]
+        self.assertEqual(merged, [0, 1, 2, 2, 3, 4, 6])
+
+        deduplicated = [carbon.getSecond() for carbon in merge(first, second, dedup=True)]
+        self.assertEqual(deduplicated, [0, 1, 2, 3, 4, 6])
+
+        records_a = [('a', base.addSeconds(1)), ('a', base.addSeconds(5))]
+        records_b = [('b', base.addSeconds(1))]
+        hosts = [host for host, _ in merge(records_a, records_b, key=lambda record: record[1], tie_break='reverse')]
+        self.assertEqual(hosts, ['b', 'a', 'a'])
+
+        nearly_sorted = [base.addSeconds(seconds) for seconds in [1, 0, 3, 2, 5, 4]]
+        reordered = [carbon.getSecond() for carbon in merge(nearly_sorted, [base.addSeconds(2)], lookahead=1)]
+        self.assertEqual(reordered, [0, 1, 2, 2, 3, 4, 5])
+
+        with self.assertRaises(ValueError):
+            merge(first, tie_break='random')
+
+    def test_carbon_date_arithmetic_and_conversion(self) -> None:
+        day = CarbonDate.parse('2024-01-31')
+
+        self.assertEqual(day.getYear(), 2024)
+        self.assertEqual(day.getMonth(), 1)
+        self.assertEqual(day.getDay(), 31)
+        self.assertEqual(day.getDayOfWeek(), Carbon.WEDNESDAY)
+        self.assertEqual(day.getQuarter(), 0)
+        self.assertEqual(day.getQuarter(start=2), 3)
+
+        self.assertEqual(day.addMonths(1).toDateString(), '2024-02-29')
+        self.assertEqual(day.addYears(1).addMonths(1).toDateString(), '2025-02-28')
+        self.assertEqual(day.subMonths(2).toDateString(), '2023-11-30')
+        self.assertEqual(day.add(2, 'weeks').toDateString(), '2024-02-14')
+        self.assertEqual(day.addDays(1).toDateString(), '2024-02-01')
+
+        self.assertEqual(day.startOfWeek().toDateString(), '2024-01-29')
+        self.assertEqual(day.endOfWeek().toDateString(), '2024-02-04')
+        self.assertEqual(day.addDays(1).endOfMonth().toDateString(), '2024-02-29')
+        self.assertEqual(day.startOf('month').toDateString(), '2024-01-01')
+        self.assertEqual(day.endOfYear().toDateString(), '2024-12-31')
+        self.assertTrue(day.endOfWeek().isWeekend())
+        self.assertFalse(day.isWeekend())
+
+        self.assertTrue(day.lessThan(day.addDays(1)))
+        self.assertTrue(day.between(day.startOfMonth(), day.endOfMonth()))
+        self.assertFalse(day.betweenExcluded(day.startOfMonth(), day))
+        self.assertEqual(sorted([day.addDays(3), day]), [day, day.addDays(3)])
+        self.assertEqual(len({day, CarbonDate.createFromDate(2024, 1, 31)}), 1)
+
+        carbon = Carbon.parse('2024-01-31 13:45:00')
+        self.assertEqual(carbon.toCarbonDate(), day)
+        self.assertEqual(day.toCarbon().toDateTimeString(), '2024-01-31 00:00:00')
+        self.assertEqual(CarbonDate(carbon).diffInDays(CarbonDate.createFromFormat('%d/%m/%Y', '01/01/2024')), 30)
+
+        with self.assertRaises(ValueError):
+            CarbonDate.createFromDate(2023, 2, 29)
+
+        for invalid in [lambda: CarbonDate(0), lambda: CarbonDate(3652060), lambda: CarbonDate.createFromDate(1, 1, 1).subMonths(1)]:
+            with self.assertRaises(ValueError):
+                invalid()
+
+        self.assertEqual(CarbonDate(1).toDateString(), '0001-01-01')
+
+        for other in [carbon, carbon.toDatetime().date(), 1]:
+            with self.assertRaises(TypeError):
+                day < other  # pylint: disable=pointless-statement
+
+    def test_create_from_format_matches_strptime(self) -> None:
+        cases = [
+            ('%Y-%m-%d %H:%M:%S', '2021-08-18 14:15:16'),
+            ('%Y-%m-%dT%H:%M:%S.%f', '2021-08-18T14:15:16.5'),
+            ('%d/%m/%y', '18/8/21'),
+            ('%H%M', '959'),
+            ('%d %b %Y', '18 Aug 2021'),
+        ]
+
+        for format_string, date_string in cases:
+            self.assertEqual(
+                Carbon.createFromFormat(format_string, date_string).toDatetime(),
+                datetime.strptime(date_string, format_string)
+            )
+
+        for format_string, date_string in [('%Y-%m-%d', '2021-08-18x'), ('%Y-%m-%d', '2021-13-01'), ('%H:%M', '24:00')]:
+            with self.assertRaises(ValueError):
+                Carbon.createFromFormat(format_string, date_string)
+
+        self.assertEqual(CarbonDate.createFromFormat('%d/%m/%Y', '18/08/2021').toDateString(), '2021-08-18')
+
+        for prefix in range(150):
+            Carbon.createFromFormat('#' + str(prefix) + ' %Y', '#' + str(prefix) + ' 2021')
+
+        self.assertLessEqual(len(formats._parsers), formats._CACHE_MAX_SIZE)  # pylint: disable=protected-access
+
+    def test_detect_gaps_in_streams_and_epoch_buffers(self) -> None:
+        base = Carbon.parse('2021-08-18 00:00:00')
+        stream = [base.addMinutes(minutes) for minutes in [0, 1, 4, 4, 3, 5]]
+
+        events = [(event.kind, event.start.getMinute(), event.end.getMinute(), event.count) for event in detect_gaps(stream, 1, 'minutes')]
+        self.assertEqual(events, [('gap', 2, 3, 2), ('duplicate', 4, 4, 1), ('out_of_order', 3, 3, 1)])
+
+        monthly = [Carbon.parse(value) for value in ['2021-01-31', '2021-02-28', '2021-05-31']]
+        gap = list(detect_gaps(monthly, 1, 'months'))[0]
+        self.assertEqual((gap.start.toDateString(), gap.end.toDateString(), gap.count), ('2021-03-31', '2021-04-30', 2))
+
+        epochs = [stamp.getTimestamp() for stamp in stream]
+        expected = [('gap', 2), ('duplicate', 1), ('out_of_order', 1)]
+        self.assertEqual([(event.kind, event.count) for event in detect_gaps_epoch(epochs, 60)], expected)
+        self.assertEqual([(event.kind, event.count) for event in gaps._scan_epoch(epochs, 60)], expected)  # pylint: disable=protected-access
+
+        for amount, unit in [(0, 'minutes'), (1, 'year')]:
+            with self.assertRaises(ValueError):
+                detect_gaps(stream, amount, unit)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_detect_gaps_epoch_vectorized(self) -> None:
+        epochs = [0.0, 60.0, 240.0, 240.0, 180.0, 300.0]
+        events = gaps._scan_epoch_vectorized(numpy, epochs, 60)  # pylint: disable=protected-access
+
+        self.assertEqual([(event.kind, event.count) for event in events], [('gap', 2), ('duplicate', 1), ('out_of_order', 1)])
+        self.assertEqual(list(gaps._scan_epoch_vectorized(numpy, epochs, 60)), list(gaps._scan_epoch(epochs, 60)))  # pylint: disable=protected-access
+
+    def test_timestamp_codec_round_trip_and_range(self) -> None:
+        base = Carbon.parse('2021-08-18 00:00:00')
+        regular = [base.addSeconds(seconds * 10) for seconds in range(2000)]
+
+        data = encode(regular, block_size=256)
+        self.assertLess(len(data) * 10, len(regular) * 8)
+
+        column = TimestampColumn(data)
+        self.assertEqual(len(column), 2000)
+        self.assertEqual(len(column.blocks()), 8)
+        self.assertTrue(all(original.equalTo(decoded) for original, decoded in zip(regular, column)))
+        self.assertEqual(column.to_epoch_array()[1] - column.to_epoch_array()[0], 10 * 1_000_000)
+
+        selected = list(column.between(base.addSeconds(95), base.addSeconds(130)))
+        self.assertEqual([carbon.toTimeString() for carbon in selected], ['00:01:40', '00:01:50', '00:02:00', '00:02:10'])
+        self.assertEqual(len(list(column.between(base.addSeconds(100), base.addSeconds(130), included=False))), 2)
+
+        irregular = [0, 1, 1, 5, -3, 10 ** 6, -(10 ** 12), 2 ** 40, 7]
+        encoder = TimestampEncoder(resolution=1, block_size=4)
+
+        for value in irregular:
+            encoder.append_epoch(value)
+
+        self.assertEqual(list(TimestampColumn(encoder.finish()).iter_epochs()), irregular)
+
+        jittered = [base.addMicroSeconds(micro * 7919) for micro in range(100)]
+        self.assertTrue(all(original.equalTo(decoded) for original, decoded in zip(jittered, TimestampColumn(encode(jittered)))))
+
+    def test_time_index_range_queries(self) -> None:
+        base = Carbon.parse('2021-08-18 00:00:00')
+        index = TimeIndex((base.addHours(hours), 'h' + str(hours)) for hours in [0, 6, 12, 18, 24, 30])
+        index.add(base.addHours(36), 'h36')
+        index.add(base.addHours(3), 'h3')
+
+        self.assertEqual(len(index), 8)
+        self.assertEqual(index.between(base.addHours(6), base.addHours(18)), ['h6', 'h12', 'h18'])
+        self.assertEqual(index.betweenExcluded(base.addHours(6), base.addHours(18)), ['h12'])
+        self.assertEqual(index.within(base.addHours(5), 'day'), ['h0', 'h3', 'h6', 'h12', 'h18'])
+
+        before = index.before(base.addHours(12))
+        self.assertEqual((before[0].toDateTimeString(), before[1]), ('2021-08-18 06:00:00', 'h6'))
+        self.assertEqual(index.before(base.addHours(12), included=True)[1], 'h12')
+        self.assertEqual(index.after(base.addHours(12))[1], 'h18')
+        self.assertIsNone(index.before(base))
+        self.assertIsNone(index.after(base.addHours(36)))
+
+        index.load([(base.subHours(1), 'early'), (base.addHours(40), 'late')])
+        self.assertEqual([value for _, value in index][0], 'early')
+        self.assertEqual([value for _, value in index][-1], 'late')
+
+    def test_month_boundaries_near_month_end(self) -> None:
+        dt = Carbon.parse('2021-08-31 10:00:00')
+
+        self.assertEqual(dt.startOfMonth().toDateTimeString(), '2021-08-01 00:00:00')
+        self.assertEqual(dt.endOfMonth().toDateTimeString(), '2021-08-31 23:59:59')
+        self.assertEqual(Carbon.parse('2020-02-10').getDaysInMonth(), 29)
+        self.assertEqual(Carbon.parse('2021-02-10').getDaysInMonth(), 28)
+        self.assertTrue(Carbon.parse('2021-02-28').isLastDayOfMonth())
+        self.assertEqual(Carbon.parse('2021-08-10').getMonthFirstWeekDay(), Carbon.SUNDAY)
+
+    def test_modify_relative_expressions(self) -> None:
+        base = Carbon.parse('2021-01-31 14:15:16')
+
+        self.assertEqual(base.modify('+1 month').toDateTimeString(), '2021-02-28 14:15:16')
+        self.assertEqual(base.modify('-2 days +3 hours').toDateTimeString(), '2021-01-29 17:15:16')
+        self.assertEqual(base.modify('3 days ago').toDateTimeString(), '2021-01-28 14:15:16')
+        self.assertEqual(base.modify('first day of next month').toDateTimeString(), '2021-02-01 00:00:00')
+        self.assertEqual(base.modify('last day of next month').toDateString(), '2021-02-28')
+        self.assertEqual(base.modify('start of week').toDateTimeString(), '2021-01-25 00:00:00')
+        self.assertEqual(base.modify('end of next year').toDateString(), '2022-12-31')
+        self.assertEqual(base.modify('tomorrow').toDateTimeString(), '2021-02-01 00:00:00')
+        self.assertEqual(base.modify('Next  Monday').toDateTimeString(), '2021-02-01 14:15:16')
+        self.assertEqual(base.modify('last monday').toDateString(), '2021-01-25')
+        self.assertEqual(base.modify('next sunday').toDateString(), '2021-02-07')
+        self.assertEqual(base.modify('previous sunday').toDateString(), '2021-01-24')
+        self.assertEqual(Carbon.parse('2021-01-26').modify('last monday').toDateString(), '2021-01-25')
+        self.assertEqual(Carbon.parse('2021-01-27').modify('next thursday').toDateString(), '2021-01-28')
+
+        dates = Carbon.modifyAll([base, base.addMonths(1)], 'first day of next month')
+        self.assertEqual([carbon.toDateString() for carbon in dates], ['2021-02-01', '2021-03-01'])
+
+        for expression in ['next', '+1 monthly', 'someday']:
+            with self.assertRaises(ValueError):
+                base.modify(expression)
+
+        for days in range(150):
+            base.modify('+' + str(days) + ' days')
+
+        self.assertLessEqual(len(modifiers._compiled), formats._CACHE_MAX_SIZE)  # pylint: disable=protected-access
+
+    def test_lazy_instances_defer_parsing(self) -> None:
+        first = Carbon.lazy('2021-08-18 10:00:00')
+        same = Carbon.lazy('2021-08-18 10:00:00')
+        later = Carbon.lazy(b'2021-08-18 10:00:01')
+
+        self.assertTrue(first.equalTo(same))
+        self.assertTrue(first.lessThan(later))
+        self.assertTrue(later.greaterThanOrEqualTo(first))
+        self.assertTrue(first.betweenIncluded(same, later))
+        self.assertFalse(first.isParsed())
+        self.assertFalse(later.isParsed())
+
+        formatted = Carbon.lazy('20210818', '%Y%m%d')
+        self.assertTrue(formatted.lessThan(Carbon.lazy('20210901', '%Y%m%d')))
+        self.assertFalse(formatted.isParsed())
+
+        padded = Carbon.lazy('2021-08- 2', '%Y-%m-%d')
+        self.assertTrue(padded.greaterThan(Carbon.lazy('2021-08-01', '%Y-%m-%d')))
+        self.assertTrue(Carbon.lazy('2021-08- 1', '%Y-%m-%d').equalTo(Carbon.lazy('2021-08-01', '%Y-%m-%d')))
+
+        for prefix in range(150):
+            Carbon.lazy('#' + str(prefix) + ' 2021', '#' + str(prefix) + ' %Y').lessThan(Carbon.lazy('#' + str(prefix) + ' 2022', '#' + str(prefix) + ' %Y'))
+
+        self.assertLessEqual(len(lazy._masks), formats._CACHE_MAX_SIZE)  # pylint: disable=protected-access
+
+        unordered = Carbon.lazy('18/08/2021', '%d/%m/%Y')
+        self.assertTrue(unordered.greaterThan(Carbon.lazy('19/07/2021', '%d/%m/%Y')))
+        self.assertTrue(unordered.isParsed())
+
+        self.assertTrue(first.equalTo(Carbon.parse('2021-08-18 10:00:00')))
+        self.assertEqual(first.addDays(1).toDateTimeString(), '2021-08-19 10:00:00')
+        self.assertEqual(first.year, 2021)
+        self.assertTrue(first.isParsed())
+
+        with self.assertRaises(ValueError):
+            Carbon.lazy('not a date', '%Y-%m-%d').getYear()
+
+    def test_period_keys_and_is_same_methods(self) -> None:
+        dt = Carbon.parse('2021-08-18 14:15:16')
+
+        self.assertEqual(dt.getDayKey(), datetime(2021, 8, 18).toordinal())
+        self.assertEqual(dt.getHourKey(), dt.getDayKey() * 24 + 14)
+        self.assertEqual(dt.getMinuteKey(), dt.getHourKey() * 60 + 15)
+        self.assertEqual(dt.getMonthKey(), 2021 * 12 + 7)
+        self.assertEqual(dt.getYearKey(), 2021)
+        self.assertEqual(dt.getQuarterKey(), Carbon.parse('2021-07-01').getQuarterKey())
+        self.assertNotEqual(dt.getQuarterKey(start=8), Carbon.parse('2021-07-01').getQuarterKey(start=8))
+
+        sunday = Carbon.parse('2021-08-22 23:00:00')
+        self.assertEqual(dt.getWeekKey(), sunday.getWeekKey())
+        self.assertEqual(dt.getWeekKey() + 1, sunday.addDays(1).getWeekKey())
+
+        self.assertTrue(dt.isSameWeek(sunday))
+        self.assertFalse(dt.isSameWeek(Carbon.parse('2021-09-15 14:15:16')))
+        self.assertFalse(dt.isSameWeek(sunday.addDays(1)))
+        self.assertTrue(dt.isSameMinute(dt.addSeconds(40)))
+        self.assertFalse(dt.isSameHour(dt.addDays(1)))
+        self.assertTrue(dt.isSameHour(dt.addDays(1), match_date=False))
+        self.assertTrue(dt.isSameDay(dt.startOfDay()))
+        self.assertFalse(dt.isSameMonth(dt.addYears(1)))
+        self.assertTrue(dt.isSameYear(dt.startOfYear()))
+        self.assertTrue(dt.isSameQuarter(Carbon.parse('2021-07-01')))
+        self.assertFalse(dt.isSameQuarter(Carbon.parse('2021-07-01'), start=8))
+        self.assertTrue(dt.isSameQuarter(Carbon.parse('2022-10-01'), match_date=False, start=11))
+
+        days = Carbon.periodKeys([dt, sunday, dt.addDays(1)], 'day')
+        self.assertEqual(days, [dt.getDayKey(), sunday.getDayKey(), dt.getDayKey() + 1])
+        self.assertEqual(Carbon.periodKeys([Carbon.parse('2021-03-31'), Carbon.parse('2021-04-01')], 'quarter', start=4), [8083, 8084])
+
+    def test_shared_calendar_table(self) -> None:
+        name = 'python_carbon_test_' + str(os.getpid())
+
+        with CalendarTable.build(2000, 2030).publish(name, version=2):
+            table = CalendarTable.attach(name, version=2)
+
+            for raw in ('2020-02-29', '2021-08-01', '2021-08-31', '2024-12-15'):
+                dt = Carbon.parse(raw)
+                self.assertEqual(table.getDaysInMonth(dt), dt.getDaysInMonth())
+                self.assertEqual(table.getMonthFirstWeekDay(dt), dt.getMonthFirstWeekDay())
+                self.assertEqual(table.getWeekOfMonth(dt, 1), dt.getWeekOfMonth(1))
+                self.assertEqual(table.getDayKey(dt), dt.getDayKey())
+
+            with self.assertRaises(ValueError):
+                table.getDaysInMonth(Carbon.parse('1999-12-31'))
+
+            table.close()
+
+            with self.assertRaises(ValueError):
+                CalendarTable.attach(name, version=1)
+
+            with self.assertRaises(ValueError):
+                SharedTable.attach(name, kind='other')
+
 
 if __name__ == '__main__':
     unittest.main()